@@ -1,16 +1,96 @@
 # Import required libraries
+from functools import lru_cache
 import pandas as pd
 import dash
 from dash import html
 from dash import dcc
 from dash.dependencies import Input, Output
 import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+
+# Serialize callback figures and store data with orjson instead of the
+# standard json module; this fails at startup if orjson is not installed
+pio.json.config.default_engine = 'orjson'
 
 # Read the airline data into pandas dataframe
-spacex_df = pd.read_csv("spacex_launch_dash.csv")
+# with compact dtypes: 0/1 outcome as int8 and low-cardinality text as
+# category; payload stays float64 so the values shown are exactly as in the CSV
+spacex_df = pd.read_csv(
+    "spacex_launch_dash.csv",
+    dtype={
+        'class': 'int8',
+        'Launch Site': 'category',
+        'Booster Version Category': 'category',
+    }
+)
 max_payload = spacex_df['Payload Mass (kg)'].max()
 min_payload = spacex_df['Payload Mass (kg)'].min()
 
+# Pre-split the data per launch site once, sorted by payload, so the callbacks
+# only need a dict lookup and a binary search on the payload column
+SITE_DFS = {
+    site: spacex_df[spacex_df['Launch Site'] == site]
+    .sort_values('Payload Mass (kg)')
+    .reset_index(drop=True)
+    for site in spacex_df['Launch Site'].unique()
+}
+SITE_DFS['ALL'] = spacex_df.sort_values('Payload Mass (kg)').reset_index(drop=True)
+
+# Aggregated summaries per site: outcome counts for the pie chart and
+# payload-sorted (payload, class) arrays per booster category for the scatter
+COUNTS = {
+    site: df.groupby('class').size().reindex([0, 1], fill_value=0)
+    for site, df in SITE_DFS.items()
+}
+SCATTER = {}
+for site, df in SITE_DFS.items():
+    # Keep px.scatter's trace order: categories by first appearance in the CSV
+    rows = spacex_df if site == 'ALL' else spacex_df[spacex_df['Launch Site'] == site]
+    groups = df.groupby('Booster Version Category', observed=True)
+    SCATTER[site] = {}
+    for cat in pd.unique(rows['Booster Version Category']):
+        sub = groups.get_group(cat)
+        SCATTER[site][cat] = (sub['Payload Mass (kg)'].values, sub['class'].values)
+# Fixed colour per booster category so it does not change between sites,
+# assigned in order of first appearance like px and cycling the palette
+_PALETTE = px.colors.qualitative.Plotly
+BOOSTER_COLORS = {
+    cat: _PALETTE[i % len(_PALETTE)]
+    for i, cat in enumerate(pd.unique(spacex_df['Booster Version Category']))
+}
+
+# Figure templates with the layout already set; callbacks only add the data
+_PIE_TMPL = go.Figure(layout=go.Layout(legend_tracegroupgap=0))
+# Scatter layout for the browser, built through go.Figure so that it carries
+# the default plotly template like the pie chart
+_SCAT_LAYOUT = go.Figure(layout=go.Layout(
+    xaxis_title='Payload Mass (kg)',
+    yaxis_title='class',
+    legend_title_text='Booster Version Category'
+)).layout.to_plotly_json()
+
+# Per-site scatter data sent to the browser once per site change; the
+# payload slider then filters it client-side without a server round-trip
+SITE_DATA = {}
+for site, categories in SCATTER.items():
+    if site == 'ALL':
+        title = 'Correlation between Payload and Success for All Sites'
+    else:
+        title = f'Correlation between Payload and Success for site {site}'
+    SITE_DATA[site] = {
+        'layout': dict(_SCAT_LAYOUT, title={'text': title}),
+        'traces': [
+            {
+                'name': cat,
+                'color': BOOSTER_COLORS[cat],
+                'x': payload.tolist(),  # sorted, so JS can binary search it
+                'y': outcome.tolist(),
+            }
+            for cat, (payload, outcome) in categories.items()
+        ],
+    }
+
 # Create a dash application
 app = dash.Dash(__name__)
 
@@ -51,6 +131,7 @@ app.layout = html.Div(children=[
         },
         value=[0, 10000]  # Example start values
     ),
+    dcc.Store(id='site-data'),
     dcc.Graph(id='success-payload-scatter-chart')
 ])
 # Task 2 Function decorator to specify function input and output
@@ -59,24 +140,29 @@ app.layout = html.Div(children=[
     Input(component_id='site-dropdown', component_property='value')
 )
 def get_pie_chart(entered_site):
+    # A cleared dropdown (None) or unknown site shows an empty chart
+    if entered_site not in COUNTS:
+        return go.Figure(_PIE_TMPL)
+    return _build_pie(entered_site)
+
+# There are only a handful of sites, so each pie is built once and reused;
+# the cached figure is a plain dict that Dash serializes without mutating it
+@lru_cache(maxsize=8)
+def _build_pie(entered_site):
     # If 'ALL' is selected, show overall success vs. failure counts
     if entered_site == 'ALL':
-        fig = px.pie(
-            spacex_df,
-            names='class',  # Show total successful vs failed launches
-            title='Total Success vs Failure Launches (All Sites)',
-        )
-        return fig
+        title = 'Total Success vs Failure Launches (All Sites)'
     else:
-        # Filter data for the selected site
-        filtered_df = spacex_df[spacex_df['Launch Site'] == entered_site]
-        fig = px.pie(
-            filtered_df,
-            names='class',  # Show success vs failure for this site
-            title=f'Success vs Failure Launches for site {entered_site}',
-        )
-        return fig
-        
+        title = f'Success vs Failure Launches for site {entered_site}'
+    fig = go.Figure(_PIE_TMPL)
+    fig.add_trace(go.Pie(
+        labels=[0, 1],  # Show successful vs failed launches
+        values=COUNTS[entered_site].values,
+        hovertemplate='class=%{label}<extra></extra>'
+    ))
+    fig.update_layout(title=title)
+    return fig.to_dict()
+
 # Task 3: Add a RangeSlider for payload mass selection
 dcc.RangeSlider(
     id='payload-slider',
@@ -93,37 +179,61 @@ dcc.RangeSlider(
     value=[0,10000]  # Replace min_value and max_value with your desired initial range
 )
 
-# Task 4 
+# Task 4
 @app.callback(
-    Output(component_id='success-payload-scatter-chart', component_property='figure'),
-    Input(component_id='site-dropdown', component_property='value'),
-    Input(component_id='payload-slider', component_property='value')
+    Output(component_id='site-data', component_property='data'),
+    Input(component_id='site-dropdown', component_property='value')
 )
-def update_scatter_chart(selected_site, selected_payload_range):
-    low, high = selected_payload_range
-    filtered_df = spacex_df[
-        (spacex_df['Payload Mass (kg)'] >= low) &
-        (spacex_df['Payload Mass (kg)'] <= high)
-    ]
+def update_site_data(selected_site):
+    # A cleared dropdown (None) or unknown site shows an empty chart
+    if selected_site not in SITE_DATA:
+        return {'layout': _SCAT_LAYOUT, 'traces': []}
+    return SITE_DATA[selected_site]
 
-    if selected_site == 'ALL':
-        fig = px.scatter(
-            filtered_df,
-            x='Payload Mass (kg)',
-            y='class',
-            color='Booster Version Category',
-            title='Correlation between Payload and Success for All Sites'
-        )
-    else:
-        df_site = filtered_df[filtered_df['Launch Site'] == selected_site]
-        fig = px.scatter(
-            df_site,
-            x='Payload Mass (kg)',
-            y='class',
-            color='Booster Version Category',
-            title=f'Correlation between Payload and Success for site {selected_site}'
-        )
-    return fig
+# Filter the stored site data by payload range in the browser
+app.clientside_callback(
+    """
+    function(payloadRange, siteData) {
+        if (!siteData) {
+            return window.dash_clientside.no_update;
+        }
+        // First index with x >= value, or x > value when upper is set
+        function bisect(x, value, upper) {
+            var lo = 0, hi = x.length;
+            while (lo < hi) {
+                var mid = (lo + hi) >> 1;
+                if (x[mid] < value || (upper && x[mid] === value)) {
+                    lo = mid + 1;
+                } else {
+                    hi = mid;
+                }
+            }
+            return lo;
+        }
+        var data = [];
+        siteData.traces.forEach(function(trace) {
+            var lo = bisect(trace.x, payloadRange[0], false);
+            var hi = bisect(trace.x, payloadRange[1], true);
+            if (lo < hi) {
+                data.push({
+                    type: 'scattergl',
+                    mode: 'markers',
+                    name: trace.name,
+                    marker: {color: trace.color},
+                    hovertemplate: 'Booster Version Category=' + trace.name +
+                        '<br>Payload Mass (kg)=%{x}<br>class=%{y}<extra></extra>',
+                    x: trace.x.slice(lo, hi),
+                    y: trace.y.slice(lo, hi)
+                });
+            }
+        });
+        return {data: data, layout: siteData.layout};
+    }
+    """,
+    Output(component_id='success-payload-scatter-chart', component_property='figure'),
+    Input(component_id='payload-slider', component_property='value'),
+    Input(component_id='site-data', component_property='data')
+)
 
 # Run the app
 if __name__ == '__main__':